@@ -1,14 +1,19 @@
 from .utils.argument_parser import parse_arguments
-from .utils.config import DATA_FILE
-from .utils.project_manager import ProjectManager
 import sys
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .utils.project_manager import ProjectManager
+
 
 class HourTrack:
     """
     Main class for the HourTrack application
     """
 
+    __slots__ = ("args",)
+
     def __init__(self) -> None:
         """
         Initialize the HourTrack application
@@ -21,20 +26,21 @@ class HourTrack:
     def check_args(self):
 
         # If no command is provided, show the help message
-        if not hasattr(self.args, "command"):
+        if self.args.command is None:
             print("Error: No command provided")
             sys.exit(1)
 
         if (
             self.args.command == "info"
-            and hasattr(self.args, "output")
-            and not hasattr(self.args, "project")
+            and self.args.output is not None
+            and self.args.project is None
+            and not self.args.all
         ):
             print("Error: The --output argument requires the project argument\n")
             sys.exit(1)
 
         if self.args.command == "edit":
-            if hasattr(self.args, "rename") and not hasattr(self.args, "project"):
+            if self.args.rename is not None and self.args.project is None:
                 print("Error: The --rename argument requires the project argument\n")
                 sys.exit(1)
 
@@ -42,55 +48,87 @@ class HourTrack:
         """
         Main function for the HourTrack application
         """
-        project = getattr(self.args, "project", None)
-        format = getattr(self.args, "format", "smart")
-        hours_goal = getattr(self.args, "goal", 0)
-        hours_goal = int(hours_goal) if hours_goal else 0
-        apply_all = getattr(self.args, "all", False)
-
-        project_manager = ProjectManager(project, DATA_FILE, format, hours_goal)
-
-        if self.args.command == "start":
-            project_manager.start_project()
-
-        elif self.args.command == "init":
-            project_manager.create_project()
-
-        elif self.args.command == "stop":
-            project_manager.stop_project(apply_all)
-
-        elif self.args.command == "reset":
-            project_manager.reset_project(apply_all)
-
-        elif self.args.command == "delete":
-            project_manager.delete_project(apply_all)
-
-        elif self.args.command == "edit":
-            rename = getattr(self.args, "rename", None)
-            add_session_hours = getattr(self.args, "add_session", None)
-            remove_session_id = getattr(self.args, "delete_session", None)
-
-            if rename:
-                project_manager.rename_project(rename)
-            elif add_session_hours:
-                project_manager.add_session(add_session_hours)
-            elif remove_session_id:
-                project_manager.remove_session(remove_session_id)
-            elif isinstance(hours_goal, int):
-                project_manager.set_goal(hours_goal)
-            else:
-                print(
-                    "Error: No sufficient arguments provided for the edit command, see --help\n"
-                )
-                sys.exit(1)
+        project = self.args.project
+        format = self.args.format
+        hours_goal = int(self.args.goal) if self.args.goal else 0
+        apply_all = self.args.all
+
+        # Imported lazily so --help/--version and argument errors never pay
+        # for loading the data layer
+        from .utils.config import get_data_file
+        from .utils.project_manager import ProjectManager
+
+        project_manager = ProjectManager(project, get_data_file(), format, hours_goal)
+
+        handler = _COMMAND_TABLE.get(self.args.command)
+        if handler is None:
+            print(f"Error: Unknown command: {self.args.command}")
+            sys.exit(1)
+        handler(self, project_manager)
+
+
+def _handle_start(hourtrack: HourTrack, project_manager: "ProjectManager") -> None:
+    project_manager.start_project()
+
+
+def _handle_init(hourtrack: HourTrack, project_manager: "ProjectManager") -> None:
+    project_manager.create_project()
+
+
+def _handle_stop(hourtrack: HourTrack, project_manager: "ProjectManager") -> None:
+    project_manager.stop_project(hourtrack.args.all)
+
+
+def _handle_reset(hourtrack: HourTrack, project_manager: "ProjectManager") -> None:
+    project_manager.reset_project(hourtrack.args.all)
+
+
+def _handle_delete(hourtrack: HourTrack, project_manager: "ProjectManager") -> None:
+    project_manager.delete_project(hourtrack.args.all)
+
+
+def _handle_edit(hourtrack: HourTrack, project_manager: "ProjectManager") -> None:
+    rename = hourtrack.args.rename
+    add_session_hours = hourtrack.args.add_session
+    remove_session_id = hourtrack.args.delete_session
+
+    if rename:
+        project_manager.rename_project(rename)
+    elif add_session_hours:
+        project_manager.add_session(add_session_hours)
+    elif remove_session_id:
+        project_manager.remove_session(remove_session_id)
+    elif isinstance(project_manager.hours_goal, int):
+        project_manager.set_goal(project_manager.hours_goal)
+    else:
+        print(
+            "Error: No sufficient arguments provided for the edit command, see --help\n"
+        )
+        sys.exit(1)
+
+
+def _handle_list(hourtrack: HourTrack, project_manager: "ProjectManager") -> None:
+    active = True if hourtrack.args.list_type == "active" else False
+    project_manager.list_projects(active)
+
+
+def _handle_info(hourtrack: HourTrack, project_manager: "ProjectManager") -> None:
+    output = hourtrack.args.output
+    apply_all = hourtrack.args.all
+    project_manager.project_status(output, apply_all)
 
-        elif self.args.command == "list":
-            active = True if self.args.list_type == "active" else False
-            project_manager.list_projects(active)
 
-        elif self.args.command == "info":
-            output = getattr(self.args, "output", None)
-            project_manager.project_status(output, apply_all)
+# Dispatch table mapping each CLI command to its handler, built once at import
+_COMMAND_TABLE = {
+    "start": _handle_start,
+    "init": _handle_init,
+    "stop": _handle_stop,
+    "reset": _handle_reset,
+    "delete": _handle_delete,
+    "edit": _handle_edit,
+    "list": _handle_list,
+    "info": _handle_info,
+}
 
 
 def run():
@@ -1,9 +1,227 @@
-import argparse
+import sys
 
-from importlib.metadata import version
+from functools import lru_cache
+from typing import Optional
 
+# Shared argument choices, built once at module load
+_FORMAT_CHOICES = ("smart", "full", "short", "hours")
+_LIST_CHOICES = ("all", "active")
 
-def parse_arguments():
+# Cached version string, resolved only when -V/--version is actually used
+_VERSION = None
+
+
+def _get_version() -> str:
+    """
+    Look up the installed package version, caching the result
+
+    :return: The version string
+    """
+    global _VERSION
+    if _VERSION is None:
+        from importlib.metadata import version
+
+        _VERSION = version("hourtrack")
+    return _VERSION
+
+
+# Declarative subcommand table consumed by _build_parser. Each entry is
+# (name, help, arguments) where every argument is a (flags, kwargs) pair
+# passed straight to add_argument
+_SUBCOMMAND_SPEC = (
+    (
+        "init",
+        "Create a new empty project but don't start tracking time",
+        (
+            (("-g", "--goal"), {"type": int, "help": "Set an hour goal for a project"}),
+            (("project",), {"help": "The name of the project to create"}),
+        ),
+    ),
+    (
+        "edit",
+        "Edit a project. You can rename a project or delete/add sessions",
+        (
+            (("project",), {"help": "The name of the project to rename"}),
+            (
+                ("--delete-session",),
+                {
+                    "type": int,
+                    "help": "Remove a session by its id (or `-1` for last session), which you can see using the `info` command",
+                    "nargs": "?",
+                },
+            ),
+            (
+                ("--add-session",),
+                {
+                    "type": int,
+                    "help": "Add a session to a project ending now that started X hours ago.",
+                    "nargs": "?",
+                },
+            ),
+            (
+                ("-g", "--goal"),
+                {
+                    "type": int,
+                    "help": "Add or edit a goal for a project in hours, or remove it by setting it to 0",
+                },
+            ),
+            (
+                ("--rename",),
+                {"type": str, "help": "Rename a project with a new name", "nargs": "?"},
+            ),
+        ),
+    ),
+    (
+        "start",
+        "Start tracking time for a project, creating it if it doesn't exist",
+        ((("project",), {"help": "The name of the project to start tracking"}),),
+    ),
+    (
+        "stop",
+        "Stop tracking time for a project and finish the current session",
+        (
+            (
+                ("project",),
+                {"help": "The name of the project to stop tracking", "nargs": "?"},
+            ),
+            (("-a", "--all"), {"action": "store_true", "help": "Stop all projects"}),
+        ),
+    ),
+    (
+        "list",
+        "List all or active projects",
+        (
+            (
+                ("list_type",),
+                {"choices": _LIST_CHOICES, "help": "List all, or active projects"},
+            ),
+            (
+                ("-f", "--format"),
+                {
+                    "choices": _FORMAT_CHOICES,
+                    "default": "smart",
+                    "help": "Output format, default is 'smart'",
+                },
+            ),
+        ),
+    ),
+    (
+        "info",
+        "Show info of a project or of all projects, including time spent and sessions info, with option to output to a file",
+        (
+            (
+                ("project",),
+                {
+                    "help": "If provided, the name of the project to show status for",
+                    "nargs": "?",
+                },
+            ),
+            (
+                ("-o", "--output"),
+                {"type": str, "help": "Output destination (file path)"},
+            ),
+            (
+                ("-f", "--format"),
+                {
+                    "choices": _FORMAT_CHOICES,
+                    "default": "smart",
+                    "help": "Output format, default is 'smart'",
+                },
+            ),
+            (
+                ("-a", "--all"),
+                {"action": "store_true", "help": "Show info for all projects"},
+            ),
+        ),
+    ),
+    (
+        "reset",
+        "Delete all sessions for a project or all projects and reset the timer to 0, but don't delete",
+        (
+            (
+                ("project",),
+                {"help": "The name of the project to reset", "nargs": "?"},
+            ),
+            (("-a", "--all"), {"action": "store_true", "help": "Reset all projects"}),
+        ),
+    ),
+    (
+        "delete",
+        "Delete a project or all projects, removing all data",
+        (
+            (
+                ("project",),
+                {"help": "The name of the project to delete", "nargs": "?"},
+            ),
+            (("-a", "--all"), {"action": "store_true", "help": "Delete all projects"}),
+        ),
+    ),
+)
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> "argparse.ArgumentParser":
+    """
+    Build the argument parser. Construction is cached so repeated
+    parse_arguments calls (tests, library use) only pay for it once
+
+    Returns: argparse.ArgumentParser: The configured parser.
+    """
+    # argparse (and its gettext/textwrap dependencies) is only loaded once
+    # a real command line actually needs parsing
+    import argparse
+
+    class _LazyVersionAction(argparse.Action):
+        """
+        Like action="version", but only resolves the version when invoked,
+        so parser construction does not scan installed package metadata
+        """
+
+        def __init__(self, option_strings, dest, **kwargs):
+            super().__init__(option_strings, dest, nargs=0, **kwargs)
+
+        def __call__(self, parser, namespace, values, option_string=None):
+            print(_get_version())
+            parser.exit()
+
+    parser = argparse.ArgumentParser(
+        description="Track time spent on projects. It allows you to start, stop, edit and monitor time tracking for different projects, as well as output data to files.\n\
+            For more information on a specific command, use `hourtrack <command> -h`\n\
+                or refer to the manual at https://github.com/P-ict0/HourTrack."
+    )
+
+    # Ensure every field handlers read is always present on the namespace,
+    # so callers can use plain attribute access instead of getattr defaults
+    parser.set_defaults(
+        project=None,
+        format="smart",
+        goal=0,
+        all=False,
+        rename=None,
+        add_session=None,
+        delete_session=None,
+        output=None,
+        list_type=None,
+    )
+
+    # Add subparsers for different commands
+    subparsers = parser.add_subparsers(dest="command")
+
+    # Build every subcommand from the declarative spec
+    for name, help_text, arguments in _SUBCOMMAND_SPEC:
+        subparser = subparsers.add_parser(name, help=help_text)
+        for flags, kwargs in arguments:
+            subparser.add_argument(*flags, **kwargs)
+
+    # Version command
+    parser.add_argument(
+        "-V", "--version", action=_LazyVersionAction, help="show program's version number and exit"
+    )
+
+    return parser
+
+
+def parse_arguments(argv: Optional[list[str]] = None):
     """
     Parse command line arguments.
 
@@ -24,147 +242,23 @@ def parse_arguments():
     - -g/--goal: Set an hour goal for a project
     - -h, --help: Show help message
     - -V, --version: Show version
+
+    :param argv: The arguments to parse, defaults to sys.argv[1:]
     Returns: argparse.Namespace: The parsed arguments.
     """
-    parser = argparse.ArgumentParser(
-        description="Track time spent on projects. It allows you to start, stop, edit and monitor time tracking for different projects, as well as output data to files.\n\
-            For more information on a specific command, use `hourtrack <command> -h`\n\
-                or refer to the manual at https://github.com/P-ict0/HourTrack."
-    )
-
-    # Add subparsers for different commands
-    subparsers = parser.add_subparsers(dest="command")
-
-    # Create command
-    create_parser = subparsers.add_parser(
-        "init", help="Create a new empty project but don't start tracking time"
-    )
-    create_parser.add_argument(
-        "-g", "--goal", type=int, help="Set an hour goal for a project"
-    )
-    create_parser.add_argument("project", help="The name of the project to create")
-
-    # Edit command
-    edit_parser = subparsers.add_parser(
-        "edit",
-        help="Edit a project. You can rename a project or delete/add sessions",
-    )
-    edit_parser.add_argument("project", help="The name of the project to rename")
-    edit_parser.add_argument(
-        "--delete-session",
-        type=int,
-        help="Remove a session by its id (or `-1` for last session), which you can see using the `info` command",
-        nargs="?",
-    )
-    edit_parser.add_argument(
-        "--add-session",
-        type=int,
-        help="Add a session to a project ending now that started X hours ago.",
-        nargs="?",
-    )
-    edit_parser.add_argument(
-        "-g",
-        "--goal",
-        type=int,
-        help="Add or edit a goal for a project in hours, or remove it by setting it to 0",
-    )
-    edit_parser.add_argument(
-        "--rename", type=str, help="Rename a project with a new name", nargs="?"
-    )
-
-    # Start command, with a required project argument
-    start_parser = subparsers.add_parser(
-        "start",
-        help="Start tracking time for a project, creating it if it doesn't exist",
-    )
-    start_parser.add_argument(
-        "project", help="The name of the project to start tracking"
-    )
-
-    # Stop command, with a required project argument
-    stop_parser = subparsers.add_parser(
-        "stop", help="Stop tracking time for a project and finish the current session"
-    )
-    stop_parser.add_argument(
-        "project", help="The name of the project to stop tracking", nargs="?"
-    )
-    stop_parser.add_argument(
-        "-a", "--all", action="store_true", help="Stop all projects"
-    )
-
-    # List command, with a required list_type argument
-    list_parser = subparsers.add_parser("list", help="List all or active projects")
-    list_parser.add_argument(
-        "list_type",
-        choices=["all", "active"],
-        help="List all, or active projects",
-    )
-    list_parser.add_argument(
-        "-f",
-        "--format",
-        choices=["smart", "full", "short", "hours"],
-        default="smart",
-        help="Output format, default is 'smart'",
-    )
-
-    # Info command
-    status_parser = subparsers.add_parser(
-        "info",
-        help="Show info of a project or of all projects, including time spent and sessions info, with option to output to a file",
-    )
-    status_parser.add_argument(
-        "project",
-        help="If provided, the name of the project to show status for",
-        nargs="?",
-    )
-    status_parser.add_argument(
-        "-o",
-        "--output",
-        type=str,
-        help="Output destination (file path)",
-    )
-    status_parser.add_argument(
-        "-f",
-        "--format",
-        choices=["smart", "full", "short", "hours"],
-        default="smart",
-        help="Output format, default is 'smart'",
-    )
-    status_parser.add_argument(
-        "-a", "--all", action="store_true", help="Show info for all projects"
-    )
-
-    # Reset command, with a required project argument
-    reset_parser = subparsers.add_parser(
-        "reset",
-        help="Delete all sessions for a project or all projects and reset the timer to 0, but don't delete",
-    )
-    reset_parser.add_argument(
-        "project", help="The name of the project to reset", nargs="?"
-    )
-    reset_parser.add_argument(
-        "-a", "--all", action="store_true", help="Reset all projects"
-    )
-
-    # Delete command, with a required project argument
-    delete_parser = subparsers.add_parser(
-        "delete", help="Delete a project or all projects, removing all data"
-    )
-    delete_parser.add_argument(
-        "project", help="The name of the project to delete", nargs="?"
-    )
-    delete_parser.add_argument(
-        "-a", "--all", action="store_true", help="Delete all projects"
-    )
-
-    # Version command
-    parser.add_argument(
-        "-V", "--version", action="version", version=version("hourtrack")
-    )
+    if argv is None:
+        argv = sys.argv[1:]
 
-    return parser.parse_args()
+    # Fast path: printing the version needs no parser, and building the
+    # full subparser tree is the most expensive part of startup
+    if argv and argv[0] in ("-V", "--version"):
+        print(_get_version())
+        sys.exit(0)
 
+    args = _build_parser().parse_args(argv)
+    if args.command is not None:
+        # Intern the command so dispatch-table lookups hit the
+        # pointer-equality fast path
+        args.command = sys.intern(args.command)
+    return args
 
-if __name__ == "__main__":
-    args = parse_arguments()
-    print(args)  # Show the parsed arguments
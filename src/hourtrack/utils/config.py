@@ -1,8 +1,17 @@
 from .helpers import is_windows
+from functools import lru_cache
 import os
 
-# JSON file paths
-if is_windows():
-    DATA_FILE = os.path.join(os.getenv("APPDATA"), "hourtrack", "data.json")
-else:
-    DATA_FILE = os.path.join(os.getenv("HOME"), ".hourtrack", "data.json")
+
+@lru_cache(maxsize=1)
+def get_data_file() -> str:
+    """
+    Resolve the path to the JSON data file on first use
+
+    :return: The data file path
+    """
+    if is_windows():
+        base_dir = os.environ.get("APPDATA", os.path.expanduser("~"))
+        return os.path.join(base_dir, "hourtrack", "data.json")
+    base_dir = os.environ.get("HOME", os.path.expanduser("~"))
+    return os.path.join(base_dir, ".hourtrack", "data.json")
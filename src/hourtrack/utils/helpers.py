@@ -1,18 +1,22 @@
 import platform
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
 
 
 #########################################################################
 ######################## Check the OS ###################################
 #########################################################################
+# Computed once at import; the OS does not change while we run
+_IS_WINDOWS = platform.system() == "Windows"
+
+
 def is_windows() -> bool:
     """
     Check the OS and send the notification
 
     :return: True if the OS is Windows, False otherwise
     """
-    return True if platform.system() == "Windows" else False
+    return _IS_WINDOWS
 
 
 #########################################################################
@@ -25,13 +29,20 @@ def write_to_file(filepath: str, data: str):
     :param filepath: The file path to write the output to
     :param data: The output to write to the file
     """
-    with open(filepath, "w") as f:
-        f.write(data)
+    # Binary mode with one pre-encoded write skips the TextIOWrapper
+    # newline translation and incremental-encoder machinery
+    with open(filepath, "wb") as f:
+        f.write(data.encode("utf-8"))
 
 
 #########################################################################
 ######################## User input #####################################
 #########################################################################
+# Accepted answers (blank defaults to yes)
+_YES_ANSWERS = frozenset({"y", "yes", ""})
+_NO_ANSWERS = frozenset({"n", "no"})
+
+
 def ask_yes_no(question: str) -> bool:
     """
     Ask a yes/no question with a default to yes
@@ -39,11 +50,12 @@ def ask_yes_no(question: str) -> bool:
     :param question: The question to ask
     :return: True if the user answers yes, False otherwise
     """
+    prompt = f"{question} [Y]es/[n]o: "
     while True:
-        answer = input(f"{question} [Y]es/[n]o: ").strip().lower()
-        if answer in ["y", "yes", ""]:
+        answer = input(prompt).strip().lower()
+        if answer in _YES_ANSWERS:
             return True
-        elif answer in ["n", "no"]:
+        elif answer in _NO_ANSWERS:
             return False
         else:
             print("Please enter 'yes', 'no', or leave blank for 'yes'.")
@@ -52,147 +64,177 @@ def ask_yes_no(question: str) -> bool:
 #########################################################################
 ######################## Time formatting ################################
 #########################################################################
-def format_time(seconds: int, mode: str) -> str:
+# Time units from largest to smallest: (name, short name, seconds per unit).
+# The month is approximated as 30 days for simplicity
+_UNITS = (
+    ("month", "mo", 2592000),
+    ("week", "w", 604800),
+    ("day", "d", 86400),
+    ("hour", "h", 3600),
+    ("minute", "m", 60),
+    ("second", "s", 1),
+)
+
+
+def _split_units(seconds: int) -> tuple:
     """
-    Format seconds into a human-readable time string. It goes up to months
+    Split a number of seconds into (months, weeks, days, hours, minutes, seconds)
 
-    :param seconds: The number of seconds to format
-    :param mode: The mode to use for formatting
-        - "smart": Display in the most appropriate units (e.g. 1 hour, 30 minues)
-        - "full": Display in full (e.g. 1 hour, 30 minutes, 15 seconds)
-        - "short": Display in short (e.g. 1h 30m 15s)
-        - "hours": Display only in hours (e.g. 1)
+    :param seconds: The number of seconds to split
 
-    :return: The formatted time string
+    :return: One quantity per entry in _UNITS, largest unit first
+    """
+    values = []
+    for _, _, unit_seconds in _UNITS:
+        quantity, seconds = divmod(seconds, unit_seconds)
+        values.append(quantity)
+    return tuple(values)
+
+
+# Indexed by (value != 1), so plural selection is a lookup, not a branch
+_PLURAL = ("", "s")
+
+
+def _check_plural(value: int) -> str:
+    """
+    Returns 's' if value is not equal to 1
+
+    :param value: Value to check
+
+    Returns: 's' or ''
+    """
+    return _PLURAL[value != 1]
+
+
+def _fmt_units(values: tuple, long_names: bool) -> str:
+    """
+    Format the nonzero units in one pass over _UNITS
+
+    :param values: Unit quantities as produced by _split_units
+    :param long_names: Use full unit names instead of abbreviations
+    """
+    parts = []
+    for (name, short_name, _), value in zip(_UNITS, values):
+        if value > 0:
+            if long_names:
+                parts.append(str(value) + " " + name + _PLURAL[value != 1])
+            else:
+                parts.append(str(value) + short_name)
+    if not parts:
+        parts.append("0 seconds" if long_names else "0s")
+    return (", " if long_names else " ").join(parts)
+
+
+def _fmt_full(values: tuple) -> str:
+    """
+    Format the time string in a full format
+    """
+    return _fmt_units(values, True)
+
+
+def _fmt_short(values: tuple) -> str:
     """
+    Format the time string in a short format
+    """
+    return _fmt_units(values, False)
+
 
-    # Constants for time units
-    SECONDS_PER_MINUTE = 60
-    SECONDS_PER_HOUR = 3600
-    SECONDS_PER_DAY = 86400
-    SECONDS_PER_WEEK = 604800
-    SECONDS_PER_MONTH = 2592000  # Approximated as 30 days for simplicity
-
-    months, remainder = divmod(seconds, SECONDS_PER_MONTH)
-    weeks, remainder = divmod(remainder, SECONDS_PER_WEEK)
-    days, remainder = divmod(remainder, SECONDS_PER_DAY)
-    hours, remainder = divmod(remainder, SECONDS_PER_HOUR)
-    minutes, seconds = divmod(remainder, SECONDS_PER_MINUTE)
-
-    def format_full() -> str:
-        """
-        Format the time string in a full format
-        """
-        parts = []
-        if months > 0:
-            parts.append(f"{months} month{check_plural(months)}")
+def _fmt_smart(values: tuple) -> str:
+    """
+    Smartly format the time string based on the largest unit available
+    """
+    months, weeks, days, hours, minutes, seconds = values
+    if months > 0:
+        parts = [f"{months} month{_check_plural(months)}"]
         if weeks > 0:
-            parts.append(f"{weeks} week{check_plural(weeks)}")
+            parts.append(f"{weeks} week{_check_plural(weeks)}")
         if days > 0:
-            parts.append(f"{days} day{check_plural(days)}")
+            parts.append(f"{days} day{_check_plural(days)}")
         if hours > 0:
-            parts.append(f"{hours} hour{check_plural(hours)}")
-        if minutes > 0:
-            parts.append(f"{minutes} minute{check_plural(minutes)}")
-        if seconds > 0 or not parts:
-            parts.append(f"{seconds} second{check_plural(seconds)}")
+            parts.append(f"{hours} hour{_check_plural(hours)}")
         return ", ".join(parts)
-
-    def format_short() -> str:
-        """
-        Format the time string in a short format
-        """
-        parts = []
-        if months > 0:
-            parts.append(f"{months}mo")
-        if weeks > 0:
-            parts.append(f"{weeks}w")
+    elif weeks > 0:
+        parts = [f"{weeks} week{_check_plural(weeks)}"]
         if days > 0:
-            parts.append(f"{days}d")
+            parts.append(f"{days} day{_check_plural(days)}")
+        if hours > 0:
+            parts.append(f"{hours} hour{_check_plural(hours)}")
+        return ", ".join(parts)
+    elif days > 0:
+        parts = [f"{days} day{_check_plural(days)}"]
         if hours > 0:
-            parts.append(f"{hours}h")
+            parts.append(f"{hours} hour{_check_plural(hours)}")
         if minutes > 0:
-            parts.append(f"{minutes}m")
-        if seconds > 0 or not parts:
-            parts.append(f"{seconds}s")
-        return " ".join(parts)
-
-    def check_plural(value: int) -> Optional[str]:
-        """
-        Returns 's' if value is not equal to 1
-
-        :param value: Value to check
-
-        Returns: 's' or None
-        """
-        return "s" if value != 1 else ""
-
-    def format_smart() -> str:
-        """
-        Smartly format the time string based on the largest unit available
-        """
-        if months > 0:
-            parts = [f"{months} month{check_plural(months)}"]
-            if weeks > 0:
-                parts.append(f"{weeks} week{check_plural(weeks)}")
-            if days > 0:
-                parts.append(f"{days} day{check_plural(days)}")
-            if hours > 0:
-                parts.append(f"{hours} hour{check_plural(hours)}")
-            return ", ".join(parts)
-        elif weeks > 0:
-            parts = [f"{weeks} week{check_plural(weeks)}"]
-            if days > 0:
-                parts.append(f"{days} day{check_plural(days)}")
-            if hours > 0:
-                parts.append(f"{hours} hour{check_plural(hours)}")
-            return ", ".join(parts)
-        elif days > 0:
-            parts = [f"{days} day{check_plural(days)}"]
-            if hours > 0:
-                parts.append(f"{hours} hour{check_plural(hours)}")
-            if minutes > 0:
-                parts.append(f"{minutes} minute{check_plural(minutes)}")
-            return ", ".join(parts)
-        elif hours > 0:
-            return f"{hours} hour{check_plural(hours)}, {minutes} minute{check_plural(minutes)}"
-        elif minutes > 0:
-            return f"{minutes} minute{check_plural(minutes)}, {seconds} second{check_plural(seconds)}"
-        return f"{seconds} second{check_plural(seconds)}"
-
-    def format_hours() -> str:
-        """
-        Format the time string in hours with one decimal place
-
-        Returns:
-        str: The formatted time string in hours
-        """
-        total_hours = (
-            months * (30 * 24)
-            + weeks * (7 * 24)
-            + days * 24
-            + hours
-            + minutes / 60
-            + seconds / 3600
-        )
-        return f"{round(total_hours, 1)} hours"
+            parts.append(f"{minutes} minute{_check_plural(minutes)}")
+        return ", ".join(parts)
+    elif hours > 0:
+        return f"{hours} hour{_check_plural(hours)}, {minutes} minute{_check_plural(minutes)}"
+    elif minutes > 0:
+        return f"{minutes} minute{_check_plural(minutes)}, {seconds} second{_check_plural(seconds)}"
+    return f"{seconds} second{_check_plural(seconds)}"
+
 
-    if mode == "full":
-        return format_full()
-    elif mode == "short":
-        return format_short()
-    elif mode == "smart":
-        return format_smart()
-    elif mode == "hours":
-        return format_hours()
-    else:
-        print("Error: Invalid format: {mode}")
-        print("Valid formats: 'smart', 'full', 'short', 'hours'")
+def _fmt_hours(values: tuple) -> str:
+    """
+    Format the time string in hours with one decimal place
 
+    Returns:
+    str: The formatted time string in hours
+    """
+    months, weeks, days, hours, minutes, seconds = values
+    total_hours = (
+        months * (30 * 24)
+        + weeks * (7 * 24)
+        + days * 24
+        + hours
+        + minutes / 60
+        + seconds / 3600
+    )
+    return f"{round(total_hours, 1)} hours"
+
+
+# Dispatch table mapping format mode to its renderer
+_FORMATTERS = {
+    "full": _fmt_full,
+    "short": _fmt_short,
+    "smart": _fmt_smart,
+    "hours": _fmt_hours,
+}
+
+
+@lru_cache(maxsize=512)
+def format_time(seconds: int, mode: str) -> str:
+    """
+    Format seconds into a human-readable time string. It goes up to months.
+    Results are memoized since status/list renders format the same
+    (seconds, mode) pairs repeatedly
 
+    :param seconds: The number of seconds to format
+    :param mode: The mode to use for formatting
+        - "smart": Display in the most appropriate units (e.g. 1 hour, 30 minues)
+        - "full": Display in full (e.g. 1 hour, 30 minutes, 15 seconds)
+        - "short": Display in short (e.g. 1h 30m 15s)
+        - "hours": Display only in hours (e.g. 1)
+
+    :return: The formatted time string
+    """
+
+    try:
+        formatter = _FORMATTERS[mode]
+    except KeyError:
+        raise ValueError(
+            f"Invalid format: {mode}. Valid formats: 'smart', 'full', 'short', 'hours'"
+        ) from None
+    return formatter(_split_units(seconds))
+
+
+@lru_cache(maxsize=4096)
 def format_timestamp(timestamp: str) -> str:
     """
     Format the given timestamp to a human-readable format.
+    Memoized: status renders format the same raw strings repeatedly
+    (a session's end is the next one's neighborhood, and re-renders of
+    the same file recur within one process).
 
     Parameters:
     timestamp (str): The timestamp to format.
@@ -200,10 +242,14 @@ def format_timestamp(timestamp: str) -> str:
     Returns:
     str: The formatted timestamp.
     """
-    # Parse the timestamp to a datetime object
-    dt = datetime.fromisoformat(timestamp)
-
-    # Format the datetime object to a human-readable string
-    human_readable = dt.strftime("%d-%m-%Y %H:%M:%S")
+    # Timestamps written by this app have the fixed ISO layout
+    # YYYY-MM-DDTHH:MM:SS[.ffffff], so slicing is enough and far cheaper
+    # than a full datetime parse + strftime round-trip
+    if len(timestamp) >= 19:
+        return (
+            f"{timestamp[8:10]}-{timestamp[5:7]}-{timestamp[0:4]} {timestamp[11:19]}"
+        )
 
-    return human_readable
+    # Fall back to real parsing for anything shorter (e.g. date-only input)
+    dt = datetime.fromisoformat(timestamp)
+    return dt.strftime("%d-%m-%Y %H:%M:%S")
@@ -1,14 +1,83 @@
 import json
+import mmap
 import os
+import time
 from datetime import datetime, timedelta
 from .helpers import ask_yes_no, format_time, format_timestamp, write_to_file
+from functools import lru_cache, partial
 from typing import Optional
 import sys
 
+try:
+    # Optional dependency: parses and serializes JSON several times faster
+    # than the stdlib. Everything works without it.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional dependency: C-extension ISO-8601 parser, noticeably faster
+    # than datetime.fromisoformat on old files full of string timestamps
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat
+
+
+# Separator line between projects in the apply-all report
+_SEP = "-" * 40 + "\n"
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(timestamp: str) -> datetime:
+    """
+    Memoized ISO parsing (ciso8601 when available): renders and totals
+    hit the same session strings repeatedly within one process
+
+    :param timestamp: The ISO timestamp to parse
+
+    :return: The parsed datetime
+    """
+    return _parse_datetime(timestamp)
+
+
+def _loads(raw: bytes) -> dict:
+    """
+    Deserialize JSON bytes with orjson when available
+
+    :param raw: The raw file contents
+
+    :return: The parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data: dict) -> bytes:
+    """
+    Serialize data to indented JSON bytes with orjson when available
+
+    :param data: The data to serialize
+
+    :return: The serialized bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    # ensure_ascii=False skips the per-string escape scan and writes
+    # non-ASCII project names as plain UTF-8, matching orjson's output
+    return json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+
 
 class ProjectManager:
     """
-    Manage project tracking data, file format is JSON:
+    Manage project tracking data, file format is JSON.
+
+    Sessions written by recent versions also carry "start_ts"/"end_ts"
+    epoch-second integers next to the ISO strings, so the hot paths can do
+    plain integer arithmetic; readers fall back to parsing the ISO string
+    for files written by older versions. Projects likewise carry a
+    "cached_total" running sum of their closed sessions, rebuilt lazily
+    for older files, so totals don't re-walk the session list:
 
     Project not in active session:
     ```
@@ -82,28 +151,39 @@ class ProjectManager:
         self.data_file = data_file  # path to the JSON file storing data
         self.project = project  # name of the project or None
         self.format_mode = format_mode  # mode to use for formatting time
+        # Formatter specialized on the mode once, so hot loops skip the
+        # per-call mode dispatch
+        self._format = partial(format_time, mode=format_mode)
         self.hours_goal = hours_goal  # goal (hours) for the project
-        self.init_file()  # initialize the JSON file
-        self.data = self.load_data()  # pre-load the data from the JSON file
-
-    def init_file(self) -> None:
-        """
-        Initialize the JSON file if it does not exist
-        """
-
-        if not os.path.exists(self.data_file):
-            os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-            with open(self.data_file, "w") as f:
-                json.dump({"projects": {}}, f)
+        self._data = None  # parsed lazily on first .data access
+        self._active = None  # derived from the data on load
+        self._dirty = False  # set by mutations that still need a save
+        self._last_written = None  # bytes of the last save, to skip no-op writes
 
     def load_data(self) -> dict:
         """
-        Load data from the JSON file
+        Load data from the JSON file, bootstrapping an empty one if it
+        does not exist yet. One open covers both cases instead of a
+        separate stat-and-create pass per construction
 
         :return: The loaded data
         """
-        with open(self.data_file, "r") as f:
-            return json.load(f)
+        try:
+            with open(self.data_file, "rb") as f:
+                if orjson is not None and os.path.getsize(self.data_file) > 65536:
+                    # For large histories let orjson parse straight from the
+                    # mapped pages instead of copying the file through
+                    # read(). Small files stick with the simple path.
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        # orjson rejects mmap objects; a memoryview wraps
+                        # the mapped pages without copying them
+                        return orjson.loads(memoryview(mm))
+                return _loads(f.read())
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
+            data = {"projects": {}}
+            self.save_data(data)
+            return data
 
     def save_data(self, data: dict) -> None:
         """
@@ -111,8 +191,68 @@ class ProjectManager:
 
         :param data: The data to save
         """
-        with open(self.data_file, "w") as f:
-            json.dump(data, f, indent=4)
+        # Serialize first so the file sees one large write instead of many
+        # small chunks, then rename over the old file so a crash mid-write
+        # can never leave a truncated data file behind. No fsync: CLI
+        # commands don't need crash-durability, just atomicity.
+        buf = _dumps(data)
+        if buf == self._last_written:
+            return
+        tmp_file = self.data_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(buf)
+        os.replace(tmp_file, self.data_file)
+        self._last_written = buf
+
+    @property
+    def data(self) -> dict:
+        """
+        The parsed contents of the data file, loaded on first access so
+        commands that never read existing data skip the JSON parse
+
+        :return: The loaded data
+        """
+        if self._data is None:
+            self._data = self.load_data()
+            # Projects whose latest session is still open, so activity
+            # checks are O(1) set membership instead of re-indexing
+            # session tails
+            self._active = self._compute_active()
+        return self._data
+
+    def _compute_active(self) -> set:
+        """
+        Compute the set of projects whose latest session is still open
+
+        :return: The set of active project names
+        """
+        return {
+            name
+            for name, details in self.data["projects"].items()
+            if details["sessions"] and details["sessions"][-1]["end"] is None
+        }
+
+    @staticmethod
+    def _bump_cached_total(details: dict, delta: int) -> None:
+        """
+        Adjust a project's running total of closed-session time. Projects
+        from older files may not carry the field yet; those are left
+        alone and rebuilt in full on the next calculate_total_time
+
+        :param details: The project dict
+        :param delta: Seconds to add (negative to subtract)
+        """
+        cached = details.get("cached_total")
+        if cached is not None:
+            details["cached_total"] = cached + delta
+
+    def _flush(self) -> None:
+        """
+        Write the data file once if any pending mutation marked it dirty
+        """
+        if self._dirty:
+            self.save_data(self.data)
+            self._dirty = False
 
     def exit_if_no_project(self) -> None:
         if not self.project:
@@ -130,6 +270,7 @@ class ProjectManager:
             self.data["projects"][self.project] = {
                 "hours_goal": self.hours_goal,
                 "sessions": [],
+                "cached_total": 0,
             }
             self.save_data(self.data)
             print(f"Created project: {self.project}")
@@ -141,9 +282,15 @@ class ProjectManager:
         self.exit_if_no_project()
         if self.project not in self.data["projects"]:
             # If the project does not exist, create it
-            if ask_yes_no(f"Project {self.project} does not exist. Create it?"):
-                print(f"Creating project: {self.project}")
-                self.data["projects"][self.project] = {"hours_goal": 0, "sessions": []}
+            if not ask_yes_no(f"Project {self.project} does not exist. Create it?"):
+                # Declining used to fall through and crash on the missing key
+                return
+            print(f"Creating project: {self.project}")
+            self.data["projects"][self.project] = {
+                "hours_goal": 0,
+                "sessions": [],
+                "cached_total": 0,
+            }
         # Check if the project is already being tracked, to avoid starting a new session
         elif (
             self.data["projects"][self.project]["sessions"]
@@ -153,9 +300,17 @@ class ProjectManager:
             return
 
         # Add a new session with the start time
+        now = datetime.now()
         self.data["projects"][self.project]["sessions"].append(
-            {"start": datetime.now().isoformat(), "end": None, "total_time": None}
+            {
+                "start": now.isoformat(),
+                "start_ts": int(now.timestamp()),
+                "end": None,
+                "end_ts": None,
+                "total_time": None,
+            }
         )
+        self._active.add(self.project)
         self.save_data(self.data)
         print(f"Started tracking project: {self.project}")
 
@@ -169,21 +324,33 @@ class ProjectManager:
 
         # Function to stop tracking a single project
         def stop_single_project(project: str) -> None:
-            if project in self.data["projects"]:
-                # Get the sessions for the project
-                sessions = self.data["projects"][project]["sessions"]
+            # Bind the project and its session tail once instead of
+            # re-indexing the nested dicts for every field
+            details = self.data["projects"].get(project)
+            if details is not None:
+                sessions = details["sessions"]
+                last_session = sessions[-1] if sessions else None
                 # Check if there is an active session
-                if sessions and sessions[-1]["end"] is None:
-                    # Update the end time for the session
-                    sessions[-1]["end"] = datetime.now().isoformat()
-
-                    # Calculate the total time for the session
-                    start_time = datetime.fromisoformat(sessions[-1]["start"])
-                    end_time = datetime.fromisoformat(sessions[-1]["end"])
-                    session_total_time = int((end_time - start_time).total_seconds())
-                    sessions[-1]["total_time"] = session_total_time
-
-                    self.save_data(self.data)
+                if last_session is not None and last_session["end"] is None:
+                    # Update the end time for the session, keeping the
+                    # datetime around instead of re-parsing the string we
+                    # just wrote
+                    end_time = datetime.now()
+                    end_ts = int(end_time.timestamp())
+                    last_session["end"] = end_time.isoformat()
+                    last_session["end_ts"] = end_ts
+
+                    # Calculate the total time for the session, preferring
+                    # the epoch field over parsing the ISO string
+                    start_ts = last_session.get("start_ts")
+                    if start_ts is None:
+                        start_time = _parse_iso(last_session["start"])
+                        start_ts = int(start_time.timestamp())
+                    last_session["total_time"] = end_ts - start_ts
+                    self._bump_cached_total(details, last_session["total_time"])
+
+                    self._active.discard(project)
+                    self._dirty = True
                     print(f"Stopped tracking project: {project}")
                 else:
                     # Only print if not applying to all projects
@@ -194,14 +361,22 @@ class ProjectManager:
 
         # Stop tracking all projects
         if apply_all:
+            # Nothing to stop: skip the prompt (and the per-project no-ops)
+            # by consulting the active set instead of walking every project
+            if not self.data["projects"]:
+                print("No projects to stop")
+                return
+            if not self._active:
+                print("No active projects to stop")
+                return
             if ask_yes_no("Stop tracking all projects?"):
-                for project in list(
-                    self.data["projects"].keys()
-                ):  # Use list to avoid runtime dictionary modification issues
+                # Tuple snapshot: the handler mutates the active set
+                for project in tuple(self._active):
                     stop_single_project(project)
         else:
             self.exit_if_no_project()
             stop_single_project(self.project)
+        self._flush()
 
     def add_session(self, hours: int) -> None:
         """
@@ -210,19 +385,26 @@ class ProjectManager:
         :param hours: The number of hours to add to the session
         """
         self.exit_if_no_project()
-        if self.project in self.data["projects"]:
+        # One lookup covers both the existence check and every access below
+        details = self.data["projects"].get(self.project)
+        if details is not None:
             end_time = datetime.now()
             start_time = end_time - timedelta(hours=hours)
 
             # Add a new session with the start and end time
-            self.data["projects"][self.project]["sessions"].append(
+            details["sessions"].append(
                 {
                     "start": start_time.isoformat(),
+                    "start_ts": int(start_time.timestamp()),
                     "end": end_time.isoformat(),
+                    "end_ts": int(end_time.timestamp()),
                     "total_time": hours * 3600,
                 }
             )
 
+            self._bump_cached_total(details, hours * 3600)
+            # The appended session is closed, so the tail is no longer open
+            self._active.discard(self.project)
             self.save_data(self.data)
             print(f"Added session to project: {self.project}")
         else:
@@ -242,8 +424,10 @@ class ProjectManager:
             zero_indexed_id = -1
 
         self.exit_if_no_project()
-        if self.project in self.data["projects"]:
-            sessions = self.data["projects"][self.project]["sessions"]
+        # One lookup covers both the existence check and every access below
+        details = self.data["projects"].get(self.project)
+        if details is not None:
+            sessions = details["sessions"]
             # Check if the session exists
             if len(sessions) > zero_indexed_id >= 0:
                 confirm = ask_yes_no(
@@ -261,7 +445,11 @@ class ProjectManager:
                 return
 
             if confirm:
-                del sessions[zero_indexed_id]
+                removed = sessions.pop(zero_indexed_id)
+                if removed["total_time"] is not None:
+                    self._bump_cached_total(details, -removed["total_time"])
+                if not (sessions and sessions[-1]["end"] is None):
+                    self._active.discard(self.project)
                 self.save_data(self.data)
                 session_message = (
                     f"session {session_id}" if session_id != -1 else "last session"
@@ -277,7 +465,9 @@ class ProjectManager:
         :param hours: The goal for the project in hours
         """
         self.exit_if_no_project()
-        if self.project in self.data["projects"]:
+        # One lookup covers both the existence check and the write below
+        details = self.data["projects"].get(self.project)
+        if details is not None:
             if hours == 0:
                 question_string = f"Remove goal for project {self.project}?"
                 answer_string = f"Removed goal for project {self.project}"
@@ -287,30 +477,53 @@ class ProjectManager:
                 )
                 answer_string = f"Set goal for project {self.project} to {hours} hours"
             if ask_yes_no(question_string):
-                self.data["projects"][self.project]["hours_goal"] = hours
+                details["hours_goal"] = hours
                 self.save_data(self.data)
                 print(answer_string)
         else:
             print(f"Error: Project {self.project} does not exist")
 
-    def calculate_total_time(self, project: str) -> int:
+    def calculate_total_time(self, project: str, now_ts: Optional[int] = None) -> int:
         """
         Calculate the total time for the project
 
         :param project: The name of the project
+        :param now_ts: Epoch seconds to treat as "now" for active sessions.
+            Defaults to the current time; callers looping over projects
+            pass one snapshot so every row shares a single clock read
 
         :return: The total time for the project
         """
-        total_time = 0
-        for session in self.data["projects"][project]["sessions"]:
-            if session["end"]:
-                total_time += session["total_time"]
-            else:
-                start_time = datetime.fromisoformat(session["start"])
-                total_time += int((datetime.now() - start_time).total_seconds())
+        details = self.data["projects"][project]
+        # Closed sessions are immutable, so their sum is kept as a running
+        # total updated on every mutation; only files from older versions
+        # pay for a one-off rebuild here
+        total_time = details.get("cached_total")
+        if total_time is None:
+            total_time = sum(
+                session["total_time"]
+                for session in details["sessions"]
+                if session["end"] is not None
+            )
+            details["cached_total"] = total_time
+        # An open tail session contributes its running time on top
+        if project in self._active:
+            tail = details["sessions"][-1]
+            start_ts = tail.get("start_ts")
+            if start_ts is None:
+                start_ts = int(_parse_iso(tail["start"]).timestamp())
+            if now_ts is None:
+                now_ts = int(time.time())
+            total_time += now_ts - start_ts
         return total_time
 
-    def calculate_progress_string(self, project: str, only_values: bool = False) -> str:
+    def calculate_progress_string(
+        self,
+        project: str,
+        only_values: bool = False,
+        now_ts: Optional[int] = None,
+        total_time: Optional[int] = None,
+    ) -> str:
         """
         Calculate the progress percentage and fraction for the project
         Example: 50.0% (5/10 hours)
@@ -320,14 +533,21 @@ class ProjectManager:
 
         :param project: The name of the project
         :param only_values: Whether to return only the values, without the '| Progress: ' prefix
+        :param now_ts: Epoch seconds to treat as "now", see calculate_total_time
+        :param total_time: Precomputed total for the project, so callers
+            that already summed the sessions don't trigger a second pass
 
         :return: The string representation of the progress percentage
         """
-        if not self.has_goal(project):
+        # Read the goal once via .get: three dict hops via has_goal plus a
+        # re-lookup here, and .get also tolerates projects reset before the
+        # goal field existed
+        hours_goal = self.data["projects"][project].get("hours_goal")
+        if not hours_goal:
             return ""
 
-        total_time = self.calculate_total_time(project)
-        hours_goal = self.data["projects"][project]["hours_goal"]
+        if total_time is None:
+            total_time = self.calculate_total_time(project, now_ts)
         progress_percentage = min((total_time / (hours_goal * 3600)) * 100, 100)
         progress_value = (
             f"{progress_percentage:.1f}% ({int(total_time / 3600)}/{hours_goal} hours)"
@@ -347,9 +567,7 @@ class ProjectManager:
         :return: Whether the project is active
         """
         if project in self.data["projects"]:
-            project_data = self.data["projects"][project]
-            sessions = project_data["sessions"]
-            return sessions and sessions[-1]["end"] is None
+            return project in self._active
         else:
             print(f"Error: Project {project} does not exist")
 
@@ -363,12 +581,24 @@ class ProjectManager:
         output_non_active_projects = []
         output_active_projects = []
 
+        # One clock snapshot for every row
+        now_ts = int(time.time())
+
+        # Hoist the bound methods out of the loop; CPython re-resolves
+        # attribute lookups on every iteration otherwise
+        calc_total = self.calculate_total_time
+        calc_progress = self.calculate_progress_string
+        is_active = self.is_project_active
+        fmt = self._format
+
         # Loop through all projects
         for project in self.data["projects"].keys():
-            total_time = self.calculate_total_time(project)
-            progress = self.calculate_progress_string(project)
-            time_formatted = format_time(total_time, self.format_mode)
-            if self.is_project_active(project):
+            total_time = calc_total(project, now_ts)
+            # Reuse the total just computed instead of summing the
+            # sessions a second time inside the progress helper
+            progress = calc_progress(project, total_time=total_time)
+            time_formatted = fmt(total_time)
+            if is_active(project):
                 active_projects += 1
                 output_active_projects.append(
                     f"  {project}: {time_formatted} (active) {progress}"
@@ -379,17 +609,16 @@ class ProjectManager:
                     f"  {project}: {time_formatted} {progress}"
                 )
 
-        # Print the output
+        # Emit the output in one write instead of a print per project
         if not active:
-            print(
+            lines = [
                 f"Total projects: {active_projects + non_active_projects} (active: {active_projects}, non-active: {non_active_projects})"
-            )
-            for project in output_active_projects + output_non_active_projects:
-                print(project)
+            ]
+            lines.extend(output_active_projects + output_non_active_projects)
         else:
-            print(f"Number of active projects: {active_projects}")
-            for project in output_active_projects:
-                print(project)
+            lines = [f"Number of active projects: {active_projects}"]
+            lines.extend(output_active_projects)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def rename_project(self, new_project: Optional[str]) -> None:
         """
@@ -400,13 +629,15 @@ class ProjectManager:
         self.exit_if_no_project()
         if not new_project:
             new_project = input(f"New name for project '{self.project}': ")
-        if self.project in self.data["projects"]:
-            if new_project in self.data["projects"]:
+        projects = self.data["projects"]
+        if self.project in projects:
+            if new_project in projects:
                 print(f"Error: Project {new_project} already exists")
             else:
-                self.data["projects"][new_project] = self.data["projects"].pop(
-                    self.project
-                )
+                projects[new_project] = projects.pop(self.project)
+                if self.project in self._active:
+                    self._active.discard(self.project)
+                    self._active.add(new_project)
                 self.save_data(self.data)
                 print(f"Renamed project {self.project} to {new_project}")
         else:
@@ -426,22 +657,31 @@ class ProjectManager:
                     ask_yes_no(f"Reset project {project}?") if not apply_all else True
                 )
                 if ask_confirmation:
-                    self.data["projects"][project] = {"sessions": []}
-                    self.save_data(self.data)
+                    self.data["projects"][project] = {
+                        "sessions": [],
+                        "cached_total": 0,
+                    }
+                    self._active.discard(project)
+                    self._dirty = True
                     print(f"Reset project {project}")
             else:
                 print(f"Error: Project {project} does not exist")
 
         # Reset all projects
         if apply_all:
+            # Nothing to reset: skip the prompt entirely
+            if not self.data["projects"]:
+                print("No projects to reset")
+                return
             if ask_yes_no("Reset all projects?"):
-                for project in list(
-                    self.data["projects"].keys()
-                ):  # Use list to avoid runtime dictionary modification issues
+                # Tuple snapshot so mutating handlers can't trip over
+                # runtime dictionary modification
+                for project in tuple(self.data["projects"]):
                     reset_single_project(project)
         else:
             self.exit_if_no_project()
             reset_single_project(self.project)
+        self._flush()
 
     def delete_project(self, apply_all: bool) -> None:
         """
@@ -457,20 +697,26 @@ class ProjectManager:
                 )
                 if ask_confirmation:
                     del self.data["projects"][project]
-                    self.save_data(self.data)
+                    self._active.discard(project)
+                    self._dirty = True
                     print(f"Deleted project {project}")
             else:
                 print(f"Error: Project {project} does not exist")
 
         if apply_all:
+            # Nothing to delete: skip the prompt entirely
+            if not self.data["projects"]:
+                print("No projects to delete")
+                return
             if ask_yes_no("Delete all projects?"):
-                for project in list(
-                    self.data["projects"].keys()
-                ):  # Use list to avoid runtime dictionary modification issues
+                # Tuple snapshot so mutating handlers can't trip over
+                # runtime dictionary modification
+                for project in tuple(self.data["projects"]):
                     delete_single_project(project)
         else:
             self.exit_if_no_project()
             delete_single_project(self.project)
+        self._flush()
 
     def has_goal(self, project: str) -> bool:
         """
@@ -480,7 +726,7 @@ class ProjectManager:
 
         :return: Whether the project has a goal set
         """
-        return self.data["projects"][project]["hours_goal"] != 0
+        return bool(self.data["projects"][project].get("hours_goal"))
 
     def project_status(
         self, output_to_file: Optional[str] = None, apply_all: bool = False
@@ -492,6 +738,10 @@ class ProjectManager:
         :param output_to_file: Path to the file to output the status to
         """
 
+        # One clock snapshot for the whole report, shared by every project
+        # and session instead of a clock read per active session
+        now_ts = int(time.time())
+
         def output_project_status(project: str) -> str:
             """
             Output the status of a single project
@@ -500,9 +750,15 @@ class ProjectManager:
 
             :return: The status output
             """
-            total_time = self.calculate_total_time(project)
-            num_sessions = len(self.data["projects"][project]["sessions"])
-            progress = self.calculate_progress_string(project, only_values=True)
+            # Dereference the project once; every field below reads from
+            # these locals instead of re-walking the nested dicts
+            details = self.data["projects"][project]
+            sessions = details["sessions"]
+            total_time = self.calculate_total_time(project, now_ts)
+            num_sessions = len(sessions)
+            progress = self.calculate_progress_string(
+                project, only_values=True, total_time=total_time
+            )
 
             is_active = self.is_project_active(project)
             if is_active:
@@ -510,62 +766,62 @@ class ProjectManager:
             else:
                 active_project_warning = ""
 
-            time_formatted = format_time(total_time, self.format_mode)
+            time_formatted = self._format(total_time)
 
-            status_output = f"Project name: {project}\n"
-            status_output += f"Total time: {time_formatted}{active_project_warning}\n"
-            if self.has_goal(project):
-                status_output += f"Progress: {progress}\n"
+            # Collect lines and join once at the end; += on a string is
+            # quadratic in the number of sessions
+            lines = [f"Project name: {project}"]
+            lines.append(f"Total time: {time_formatted}{active_project_warning}")
+            if details.get("hours_goal"):
+                lines.append(f"Progress: {progress}")
             if num_sessions == 0:
-                status_output += "(Not Started)\n"
-                return status_output
-            status_output += f"Number of sessions: {num_sessions}\n\n"
-            status_output += "Sessions:\n"
-            for id, session in enumerate(self.data["projects"][project]["sessions"]):
-                start = format_timestamp(session["start"])
-                end = (
-                    format_timestamp(session["end"])
-                    if session["end"] is not None
-                    else "Active"
-                )
-                session_total_time = (
-                    # If the session is active, add active_session_warning and calculate the time until now, otherwise use the total_time
-                    format_time(
-                        (
-                            int(
-                                (
-                                    datetime.now()
-                                    - datetime.fromisoformat(session["start"])
-                                ).total_seconds()
-                            )
-                            if session["end"] is None
-                            else session["total_time"]
-                        ),
-                        self.format_mode,
-                    )
+                lines.append("(Not Started)")
+                return "\n".join(lines) + "\n"
+            lines.append(f"Number of sessions: {num_sessions}")
+            lines.append("")
+            lines.append("Sessions:")
+            fmt = self._format
+            fmt_ts = format_timestamp
+            for id, session in enumerate(sessions):
+                session_start = session["start"]
+                session_end = session["end"]
+                start = fmt_ts(session_start)
+                end = fmt_ts(session_end) if session_end is not None else "Active"
+                # Active sessions run until the shared snapshot; closed ones
+                # already carry their total
+                if session_end is None:
+                    start_ts = session.get("start_ts")
+                    if start_ts is None:
+                        start_ts = int(_parse_iso(session_start).timestamp())
+                    session_total_time = fmt(now_ts - start_ts)
+                else:
+                    session_total_time = fmt(session["total_time"])
+                lines.append(
+                    f"Session {id+1}: Start: {start}, End: {end}, Duration: {session_total_time}"
                 )
-                status_output += f"Session {id+1}: Start: {start}, End: {end}, Duration: {session_total_time}\n"
 
-            return status_output
+            return "\n".join(lines) + "\n"
 
         if apply_all:
-            all_status_output = "-" * 40 + "\n"
-            for project in list(
-                self.data["projects"].keys()
-            ):  # Use list to avoid runtime dictionary modification issues
-                all_status_output += output_project_status(project) + "\n"
-                all_status_output += "-" * 40 + "\n"
+            # Collect the fragments and join once instead of growing a
+            # string per project
+            parts = [_SEP]
+            # Read-only loop: iterate the dict directly, no snapshot needed
+            for project in self.data["projects"]:
+                parts.append(output_project_status(project) + "\n")
+                parts.append(_SEP)
+            all_status_output = "".join(parts)
 
             if output_to_file:
                 if not output_to_file.endswith(".txt"):
                     output_to_file += ".txt"
-                if os.path.exists(os.path.dirname(output_to_file)):
-                    if ask_yes_no(f"{output_to_file} already exists. Overwrite?"):
-                        write_to_file(output_to_file, all_status_output)
-                        print(f"Outputted status of all projects to {output_to_file}")
-                    else:
-                        sys.exit(0)
-
+                # Prompt only when the target file itself already exists
+                # (the old check looked at its parent directory), and
+                # honour the answer with a single write
+                if os.path.exists(output_to_file) and not ask_yes_no(
+                    f"{output_to_file} already exists. Overwrite?"
+                ):
+                    sys.exit(0)
                 write_to_file(output_to_file, all_status_output)
                 print(f"Outputted status of all projects to {output_to_file}")
             else: